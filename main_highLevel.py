@@ -16,11 +16,15 @@ Usage:
 from __future__ import annotations
 
 import math
-import time
+import tkinter
 import turtle
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import NamedTuple
+from functools import partial
+from itertools import groupby
+from operator import attrgetter
+from typing import ClassVar, NamedTuple
 
 
 # ---------------------------------------------------------------------------
@@ -37,8 +41,10 @@ PROJECTION_SCALE = 100
 PROJECTION_NEAR_PLANE_EPSILON = 0.001
 
 OFF_SCREEN_THRESHOLD = 8000
-TARGET_FRAME_INTERVAL = 0.012  # ~83 FPS
-IDLE_SLEEP_SECONDS = 0.001
+SCENE_CANVAS_TAG = "scene"  # Tk canvas tag shared by every wireframe line
+TARGET_FRAME_INTERVAL_MS = 12  # ~83 FPS
+SETTLED_FRAME_INTERVAL_MS = 20  # Tick interval while nothing on screen changes
+SETTLED_EPSILON = 1e-5  # Camera counts as settled once this close to target
 
 # Default camera state
 DEFAULT_ROTATION_X = 0.450
@@ -51,6 +57,7 @@ ZOOM_SPEED = 0.1
 PAN_SPEED = 5
 SMOOTHING_FACTOR = 0.12
 MIN_ZOOM = 0.1
+ROTATION_CHANGE_EPSILON = 1e-6  # Smaller per-frame steps leave depth order intact
 
 # HUD layout
 HUD_LEFT_X = -580
@@ -67,74 +74,34 @@ HUD_FONT_BODY = ("Arial", 10, "normal")
 # ---------------------------------------------------------------------------
 
 
-class ScreenPoint(NamedTuple):
-    """A 2D point in screen-space pixel coordinates."""
-
-    x: float
-    y: float
-
-
 @dataclass(frozen=True, slots=True)
 class Vector3:
-    """An immutable point or direction in 3D space.
+    """An immutable point in 3D world space.
 
-    Provides rotation helpers for each principal axis using standard
-    rotation matrices, and a perspective projection to screen coordinates.
+    Scene builders obtain shared instances through :meth:`get`; camera
+    transformation and projection happen in bulk in
+    :meth:`SceneBuffers.project_edges`.
     """
 
     x: float
     y: float
     z: float
 
-    # -- Rotations (return new Vector3, original is unchanged) -------------
-
-    def rotated_around_x(self, angle_radians: float) -> Vector3:
-        """Rotate this vector around the X axis by *angle_radians*."""
-        cos_angle = math.cos(angle_radians)
-        sin_angle = math.sin(angle_radians)
-        new_y = self.y * cos_angle - self.z * sin_angle
-        new_z = self.y * sin_angle + self.z * cos_angle
-        return Vector3(self.x, new_y, new_z)
-
-    def rotated_around_y(self, angle_radians: float) -> Vector3:
-        """Rotate this vector around the Y axis by *angle_radians*."""
-        cos_angle = math.cos(angle_radians)
-        sin_angle = math.sin(angle_radians)
-        new_x = self.x * cos_angle + self.z * sin_angle
-        new_z = -self.x * sin_angle + self.z * cos_angle
-        return Vector3(new_x, self.y, new_z)
-
-    def rotated_around_z(self, angle_radians: float) -> Vector3:
-        """Rotate this vector around the Z axis by *angle_radians*."""
-        cos_angle = math.cos(angle_radians)
-        sin_angle = math.sin(angle_radians)
-        new_x = self.x * cos_angle - self.y * sin_angle
-        new_y = self.x * sin_angle + self.y * cos_angle
-        return Vector3(new_x, new_y, self.z)
-
-    def scaled(self, factor: float) -> Vector3:
-        """Return a uniformly scaled copy of this vector."""
-        return Vector3(self.x * factor, self.y * factor, self.z * factor)
-
-    # -- Projection --------------------------------------------------------
-
-    def project_to_screen(
-        self,
-        focal_distance: float = PROJECTION_DISTANCE,
-    ) -> ScreenPoint:
-        """Perspective-project this 3D point onto 2D screen coordinates.
+    # Interned instances handed out by get(), keyed by coordinates
+    _cache: ClassVar[dict[tuple[float, float, float], Vector3]] = {}
+
+    @classmethod
+    def get(cls, x: float, y: float, z: float) -> Vector3:
+        """Return a shared instance for (*x*, *y*, *z*), creating it once.
 
-        Returns (0, 0) when the point is at or behind the near plane to
-        prevent division-by-zero artefacts.
+        Vectors are immutable, so scene builders can reuse one instance for
+        every corner that lands on the same coordinates.
         """
-        denominator = self.z + focal_distance
-        if abs(denominator) < PROJECTION_NEAR_PLANE_EPSILON:
-            return ScreenPoint(0.0, 0.0)
-        perspective_factor = focal_distance / denominator
-        return ScreenPoint(
-            self.x * perspective_factor * PROJECTION_SCALE,
-            self.y * perspective_factor * PROJECTION_SCALE,
-        )
+        key = (x, y, z)
+        vector = cls._cache.get(key)
+        if vector is None:
+            vector = cls._cache[key] = cls(x, y, z)
+        return vector
 
 
 # ---------------------------------------------------------------------------
@@ -149,14 +116,173 @@ class RidgeAxis(Enum):
     Z = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class WireframeObject:
-    """A colored wireframe mesh defined by vertices and edge index-pairs."""
+    """A colored wireframe mesh defined by vertices and edge index-pairs.
 
-    vertices: list[Vector3]
-    edges: list[tuple[int, int]]
+    Geometry is stored as packed typed arrays rather than lists of
+    ``Vector3`` objects, so each vertex costs 12 bytes of contiguous memory
+    instead of a separate Python object.
+    """
+
+    coordinates: array  # float32 x0, y0, z0, x1, y1, z1, ...
+    edges: array  # int32 start0, end0, start1, end1, ...
     color: str
 
+    @classmethod
+    def from_vertices(
+        cls,
+        vertices: list[Vector3],
+        edges: list[tuple[int, int]],
+        color: str,
+    ) -> WireframeObject:
+        """Pack *vertices* and *edges* into typed arrays."""
+        coordinates = array("f")
+        for vertex in vertices:
+            coordinates.extend((vertex.x, vertex.y, vertex.z))
+        edge_indices = array("i", [index for edge in edges for index in edge])
+        return cls(coordinates, edge_indices, color)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.coordinates) // 3
+
+
+class ObjectSpan(NamedTuple):
+    """Where one wireframe object lives inside the flattened scene buffers."""
+
+    vertex_offset: int
+    vertex_count: int
+    edge_offset: int
+    edge_count: int
+    color_id: int  # Index into SceneBuffers.palette
+
+
+# Final pan-adjusted endpoints (x1, y1, x2, y2) of one drawable edge, in Tk
+# canvas coordinates (Y grows downward, unlike turtle coordinates)
+Segment = tuple[float, float, float, float]
+
+
+class EdgeProjection(NamedTuple):
+    """Everything the draw stage needs for one frame."""
+
+    depth: list[float]  # Camera-space Z per vertex, used for depth sorting
+    segments: list[Segment | None]  # Per edge; None when the edge is culled
+
+
+@dataclass
+class SceneBuffers:
+    """The whole scene packed into flat vertex and edge buffers.
+
+    Keeping every vertex in one contiguous list lets the renderer transform
+    the entire scene with a single pass per frame instead of re-transforming
+    each vertex once per edge it belongs to.
+    """
+
+    coordinates: array  # float32 x0, y0, z0, x1, y1, z1, ...
+    edge_starts: array  # int32 first endpoint of each edge (global vertex index)
+    edge_ends: array  # int32 second endpoint of each edge (global vertex index)
+    spans: list[ObjectSpan]
+    palette: list[str]  # Distinct object colors, indexed by color_id
+
+    @classmethod
+    def from_objects(cls, objects: list[WireframeObject]) -> SceneBuffers:
+        """Flatten *objects* into one buffer, remapping edges to global indices."""
+        coordinates = array("f")
+        edge_starts = array("i")
+        edge_ends = array("i")
+        spans: list[ObjectSpan] = []
+        color_ids: dict[str, int] = {}
+        for wireframe_object in objects:
+            vertex_offset = len(coordinates) // 3
+            vertex_count = wireframe_object.vertex_count
+            edge_offset = len(edge_starts)
+            coordinates.extend(wireframe_object.coordinates)
+            object_edges = wireframe_object.edges
+            for start_index, end_index in zip(object_edges[0::2], object_edges[1::2]):
+                if start_index < vertex_count and end_index < vertex_count:
+                    edge_starts.append(vertex_offset + start_index)
+                    edge_ends.append(vertex_offset + end_index)
+            color_id = color_ids.setdefault(wireframe_object.color, len(color_ids))
+            spans.append(
+                ObjectSpan(
+                    vertex_offset,
+                    vertex_count,
+                    edge_offset,
+                    len(edge_starts) - edge_offset,
+                    color_id,
+                )
+            )
+        return cls(coordinates, edge_starts, edge_ends, spans, list(color_ids))
+
+    def project_edges(
+        self,
+        matrix: tuple[float, ...],
+        offset_x: float,
+        offset_y: float,
+    ) -> EdgeProjection:
+        """Transform, project, and cull the whole scene in one call.
+
+        *matrix* is a row-major 3x3 camera matrix.  Every vertex is
+        transformed and perspective-projected exactly once; an edge is culled
+        when either endpoint is at or behind the near plane or projects
+        beyond ``OFF_SCREEN_THRESHOLD``.  Surviving edges come back as
+        ready-to-draw canvas segments with the camera pan already applied.
+        """
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+        coordinates = self.coordinates
+
+        # Bind every per-vertex constant and method to a local up front; the
+        # loop below then runs without global or attribute lookups.
+        focal_distance = PROJECTION_DISTANCE
+        projection_numerator = PROJECTION_DISTANCE * PROJECTION_SCALE
+        near_plane = PROJECTION_NEAR_PLANE_EPSILON
+        upper_limit = OFF_SCREEN_THRESHOLD
+        lower_limit = -OFF_SCREEN_THRESHOLD
+        depth: list[float] = []
+        screen_points: list[tuple[float, float] | None] = []
+        add_depth = depth.append
+        add_point = screen_points.append
+
+        for x, y, z in zip(coordinates[0::3], coordinates[1::3], coordinates[2::3]):
+            camera_z = m20 * x + m21 * y + m22 * z
+            add_depth(camera_z)
+            denominator = camera_z + focal_distance
+            if denominator <= near_plane:
+                add_point(None)
+                continue
+            factor = projection_numerator / denominator
+            projected_x = (m00 * x + m01 * y + m02 * z) * factor
+            projected_y = (m10 * x + m11 * y + m12 * z) * factor
+            # Chained range tests avoid two abs() calls per vertex
+            if not (
+                lower_limit <= projected_x <= upper_limit
+                and lower_limit <= projected_y <= upper_limit
+            ):
+                add_point(None)
+                continue
+            add_point((projected_x + offset_x, -projected_y - offset_y))
+
+        # Gather both endpoints of every edge with C-level lookups, leaving
+        # only the cull test and tuple join to the comprehension.
+        point_at = screen_points.__getitem__
+        segments: list[Segment | None] = [
+            None if point_a is None or point_b is None else point_a + point_b
+            for point_a, point_b in zip(
+                map(point_at, self.edge_starts), map(point_at, self.edge_ends)
+            )
+        ]
+
+        return EdgeProjection(depth, segments)
+
+    def object_depths(self, depth: list[float]) -> list[float]:
+        """Return each object's mean camera-space Z, in ``spans`` order."""
+        return [
+            sum(depth[span.vertex_offset : span.vertex_offset + span.vertex_count])
+            / span.vertex_count
+            for span in self.spans
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Scene Builder — creates the suburban neighborhood
@@ -198,16 +324,16 @@ class SuburbanSceneBuilder:
         half_depth = depth / 2
 
         bottom_vertices = [
-            Vector3(center_x - half_width, base_y, center_z - half_depth),
-            Vector3(center_x + half_width, base_y, center_z - half_depth),
-            Vector3(center_x + half_width, base_y, center_z + half_depth),
-            Vector3(center_x - half_width, base_y, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y, center_z + half_depth),
         ]
         top_vertices = [
-            Vector3(center_x - half_width, base_y + height, center_z - half_depth),
-            Vector3(center_x + half_width, base_y + height, center_z - half_depth),
-            Vector3(center_x + half_width, base_y + height, center_z + half_depth),
-            Vector3(center_x - half_width, base_y + height, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y + height, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y + height, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y + height, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y + height, center_z + half_depth),
         ]
         vertices = bottom_vertices + top_vertices
 
@@ -228,7 +354,7 @@ class SuburbanSceneBuilder:
             (2, 6),
             (3, 7),
         ]
-        self._objects.append(WireframeObject(vertices, edges, color))
+        self._objects.append(WireframeObject.from_vertices(vertices, edges, color))
 
     def _add_prism_roof(
         self,
@@ -246,22 +372,22 @@ class SuburbanSceneBuilder:
         half_depth = depth / 2
 
         base_vertices = [
-            Vector3(center_x - half_width, base_y, center_z - half_depth),
-            Vector3(center_x + half_width, base_y, center_z - half_depth),
-            Vector3(center_x + half_width, base_y, center_z + half_depth),
-            Vector3(center_x - half_width, base_y, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y, center_z - half_depth),
+            Vector3.get(center_x + half_width, base_y, center_z + half_depth),
+            Vector3.get(center_x - half_width, base_y, center_z + half_depth),
         ]
 
         if ridge_axis == RidgeAxis.Z:
             ridge_vertices = [
-                Vector3(center_x, base_y + peak_height, center_z - half_depth),
-                Vector3(center_x, base_y + peak_height, center_z + half_depth),
+                Vector3.get(center_x, base_y + peak_height, center_z - half_depth),
+                Vector3.get(center_x, base_y + peak_height, center_z + half_depth),
             ]
             slope_edges = [(0, 4), (1, 4), (2, 5), (3, 5)]
         else:
             ridge_vertices = [
-                Vector3(center_x - half_width, base_y + peak_height, center_z),
-                Vector3(center_x + half_width, base_y + peak_height, center_z),
+                Vector3.get(center_x - half_width, base_y + peak_height, center_z),
+                Vector3.get(center_x + half_width, base_y + peak_height, center_z),
             ]
             slope_edges = [(0, 4), (3, 4), (1, 5), (2, 5)]
 
@@ -277,7 +403,7 @@ class SuburbanSceneBuilder:
             # Ridge line
             (4, 5),
         ]
-        self._objects.append(WireframeObject(vertices, edges, color))
+        self._objects.append(WireframeObject.from_vertices(vertices, edges, color))
 
     # -- Composite building helpers ----------------------------------------
 
@@ -423,6 +549,17 @@ class CameraState:
     target_offset_x: float = 0.0
     target_offset_y: float = 0.0
 
+    # Set by interpolate_toward_targets() when the rotation moved this frame
+    rotation_dirty: bool = field(default=True, init=False, repr=False)
+
+    # Last composite_matrix() result, keyed by its quantized inputs
+    _matrix_cache_key: tuple[float, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _matrix_cache: tuple[float, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
     def reset_to_defaults(self) -> None:
         """Smoothly return the camera to the default viewing angle."""
         self.target_rotation_x = DEFAULT_ROTATION_X
@@ -433,20 +570,69 @@ class CameraState:
         self.target_offset_y = 0.0
 
     def interpolate_toward_targets(self, blend: float = SMOOTHING_FACTOR) -> None:
-        """Linearly interpolate current values toward their targets."""
-        self.rotation_x += (self.target_rotation_x - self.rotation_x) * blend
-        self.rotation_y += (self.target_rotation_y - self.rotation_y) * blend
-        self.rotation_z += (self.target_rotation_z - self.rotation_z) * blend
+        """Linearly interpolate current values toward their targets.
+
+        Also updates :attr:`rotation_dirty`, which tells the renderer whether
+        the depth order computed on an earlier frame can be reused.
+        """
+        step_x = (self.target_rotation_x - self.rotation_x) * blend
+        step_y = (self.target_rotation_y - self.rotation_y) * blend
+        step_z = (self.target_rotation_z - self.rotation_z) * blend
+        self.rotation_x += step_x
+        self.rotation_y += step_y
+        self.rotation_z += step_z
+        self.rotation_dirty = (
+            max(abs(step_x), abs(step_y), abs(step_z)) > ROTATION_CHANGE_EPSILON
+        )
         self.zoom += (self.target_zoom - self.zoom) * blend
         self.offset_x += (self.target_offset_x - self.offset_x) * blend
         self.offset_y += (self.target_offset_y - self.offset_y) * blend
 
-    def transform_vertex(self, vertex: Vector3) -> Vector3:
-        """Apply camera rotations and zoom to a world-space vertex."""
-        rotated = vertex.rotated_around_x(self.rotation_x)
-        rotated = rotated.rotated_around_y(self.rotation_y)
-        rotated = rotated.rotated_around_z(self.rotation_z)
-        return rotated.scaled(self.zoom)
+    def is_settled(self, tolerance: float = SETTLED_EPSILON) -> bool:
+        """Return True once every current value has reached its target."""
+        return (
+            abs(self.target_rotation_x - self.rotation_x) < tolerance
+            and abs(self.target_rotation_y - self.rotation_y) < tolerance
+            and abs(self.target_rotation_z - self.rotation_z) < tolerance
+            and abs(self.target_zoom - self.zoom) < tolerance
+            and abs(self.target_offset_x - self.offset_x) < tolerance
+            and abs(self.target_offset_y - self.offset_y) < tolerance
+        )
+
+    def composite_matrix(self) -> tuple[float, ...]:
+        """Return ``zoom * Rz @ Ry @ Rx`` as a row-major 9-tuple.
+
+        The six trig values are evaluated once so a whole vertex buffer can
+        share them.  The result is cached and reused until one of the inputs
+        changes at the fifth decimal place, which is far below anything
+        visible on screen.
+        """
+        cache_key = (
+            round(self.rotation_x, 5),
+            round(self.rotation_y, 5),
+            round(self.rotation_z, 5),
+            round(self.zoom, 5),
+        )
+        if cache_key == self._matrix_cache_key:
+            return self._matrix_cache
+
+        cos_x, sin_x = math.cos(self.rotation_x), math.sin(self.rotation_x)
+        cos_y, sin_y = math.cos(self.rotation_y), math.sin(self.rotation_y)
+        cos_z, sin_z = math.cos(self.rotation_z), math.sin(self.rotation_z)
+        zoom = self.zoom
+        self._matrix_cache_key = cache_key
+        self._matrix_cache = (
+            zoom * cos_z * cos_y,
+            zoom * (cos_z * sin_y * sin_x - sin_z * cos_x),
+            zoom * (cos_z * sin_y * cos_x + sin_z * sin_x),
+            zoom * sin_z * cos_y,
+            zoom * (sin_z * sin_y * sin_x + cos_z * cos_x),
+            zoom * (sin_z * sin_y * cos_x - cos_z * sin_x),
+            zoom * -sin_y,
+            zoom * cos_y * sin_x,
+            zoom * cos_y * cos_x,
+        )
+        return self._matrix_cache
 
 
 # ---------------------------------------------------------------------------
@@ -481,14 +667,23 @@ class InputHandler:
             "Page_Up",
             "Page_Down",
         ]
+        # partial() over the set's bound methods keeps each key event a
+        # C-level call instead of a Python lambda that looks up self.
+        press_key = self._held_keys.add
+        release_key = self._held_keys.discard
         for key in continuous_keys:
-            self._screen.onkeypress(self._make_press_handler(key), key)
-            self._screen.onkeyrelease(self._make_release_handler(key), key)
+            self._screen.onkeypress(partial(press_key, key), key)
+            self._screen.onkeyrelease(partial(release_key, key), key)
 
         # Single-press actions
         self._screen.onkey(on_reset, "r")
         self._screen.onkey(on_exit, "Escape")
 
+    @property
+    def has_held_keys(self) -> bool:
+        """True while at least one continuous-movement key is held down."""
+        return bool(self._held_keys)
+
     def apply_held_keys_to_camera(self) -> None:
         """Adjust camera targets based on whichever keys are currently held."""
         cam = self._camera
@@ -523,14 +718,6 @@ class InputHandler:
         if "Page_Down" in self._held_keys:
             cam.target_offset_y -= PAN_SPEED
 
-    # -- Internal helpers --------------------------------------------------
-
-    def _make_press_handler(self, key: str):
-        return lambda: self._held_keys.add(key)
-
-    def _make_release_handler(self, key: str):
-        return lambda: self._held_keys.discard(key)
-
 
 # ---------------------------------------------------------------------------
 # Heads-Up Display — on-screen text overlay
@@ -538,37 +725,50 @@ class InputHandler:
 
 
 class HeadsUpDisplay:
-    """Renders control hints and camera telemetry on the turtle canvas."""
+    """Renders control hints and camera telemetry on the turtle canvas.
 
-    def __init__(self, pen: turtle.Turtle) -> None:
-        self._pen = pen
+    Hints and telemetry each get their own pen so neither is erased when the
+    scene is redrawn.  Hints are written once; telemetry is rewritten only
+    when its displayed text changes, since every ``write`` costs a round trip
+    through Tk's text renderer.
+    """
+
+    def __init__(self, hint_pen: turtle.Turtle, telemetry_pen: turtle.Turtle) -> None:
+        self._hint_pen = hint_pen
+        self._telemetry_pen = telemetry_pen
+        self._hints_drawn = False
+        self._last_telemetry: list[str] | None = None
 
     def draw(self, camera: CameraState, object_count: int) -> None:
-        """Write the full HUD to the screen."""
-        self._draw_control_hints()
+        """Bring the HUD up to date, skipping any part that is unchanged."""
+        if not self._hints_drawn:
+            self._draw_control_hints()
+            self._hints_drawn = True
         self._draw_camera_telemetry(camera, object_count)
 
     # -- Private -----------------------------------------------------------
 
+    @staticmethod
     def _write_at(
-        self,
+        pen: turtle.Turtle,
         x: float,
         y: float,
         text: str,
         font: tuple = HUD_FONT_BODY,
     ) -> None:
-        self._pen.penup()
-        self._pen.goto(x, y)
-        self._pen.color("black")
-        self._pen.write(text, font=font)
+        pen.penup()
+        pen.goto(x, y)
+        pen.color("black")
+        pen.write(text, font=font)
 
     def _draw_control_hints(self) -> None:
+        pen = self._hint_pen
         left = HUD_LEFT_X
         y = HUD_TOP_Y
-        self._write_at(left, y, "3D Rendered House", HUD_FONT_TITLE)
+        self._write_at(pen, left, y, "3D Rendered House", HUD_FONT_TITLE)
         y -= HUD_LINE_SPACING + 10
         self._write_at(
-            left, y, "Movement Controls (Hold for continuous):", HUD_FONT_HEADING
+            pen, left, y, "Movement Controls (Hold for continuous):", HUD_FONT_HEADING
         )
         hints = [
             "WASD: Rotate around X and Y axes",
@@ -581,16 +781,13 @@ class HeadsUpDisplay:
         ]
         for line in hints:
             y -= HUD_LINE_SPACING
-            self._write_at(left, y, line)
+            self._write_at(pen, left, y, line)
 
     def _draw_camera_telemetry(
         self,
         camera: CameraState,
         object_count: int,
     ) -> None:
-        right = HUD_RIGHT_X
-        y = HUD_TOP_Y
-        self._write_at(right, y, "Camera Status:", HUD_FONT_HEADING)
         telemetry_lines = [
             f"Rotation X: {camera.rotation_x:.3f}",
             f"Rotation Y: {camera.rotation_y:.3f}",
@@ -598,9 +795,18 @@ class HeadsUpDisplay:
             f"Zoom: {camera.zoom:.3f}",
             f"Objects: {object_count}",
         ]
+        if telemetry_lines == self._last_telemetry:
+            return
+        self._last_telemetry = telemetry_lines
+
+        pen = self._telemetry_pen
+        pen.clear()
+        right = HUD_RIGHT_X
+        y = HUD_TOP_Y
+        self._write_at(pen, right, y, "Camera Status:", HUD_FONT_HEADING)
         for line in telemetry_lines:
             y -= HUD_LINE_SPACING
-            self._write_at(right, y, line)
+            self._write_at(pen, right, y, line)
 
 
 # ---------------------------------------------------------------------------
@@ -619,15 +825,14 @@ class SuburbanSceneRenderer:
         self._screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
         self._screen.tracer(0)
 
-        self._pen = turtle.Turtle()
-        self._pen.speed(0)
-        self._pen.pensize(1)
-        self._pen.hideturtle()
+        self._canvas = self._screen.getcanvas()
 
         # Core systems
         self._camera = CameraState()
         self._scene_objects = SuburbanSceneBuilder().build()
-        self._hud = HeadsUpDisplay(self._pen)
+        self._scene = SceneBuffers.from_objects(self._scene_objects)
+        self._depth_sorted_spans: list[ObjectSpan] | None = None
+        self._hud = HeadsUpDisplay(self._create_pen(), self._create_pen())
         self._input_handler = InputHandler(self._screen, self._camera)
         self._input_handler.bind_all_controls(
             on_reset=self._camera.reset_to_defaults,
@@ -635,24 +840,46 @@ class SuburbanSceneRenderer:
         )
 
         # Animation state
-        self._is_running = True
-        self._previous_frame_time = time.time()
+        self._needs_redraw = True
+
+    @staticmethod
+    def _create_pen() -> turtle.Turtle:
+        """Return a hidden, instant-drawing turtle pen."""
+        pen = turtle.Turtle()
+        pen.speed(0)
+        pen.pensize(1)
+        pen.hideturtle()
+        return pen
 
     # -- Public entry point ------------------------------------------------
 
     def run(self) -> None:
-        """Start the main rendering loop (blocks until exit)."""
-        while self._is_running:
-            current_time = time.time()
-            elapsed = current_time - self._previous_frame_time
+        """Start the Tk-driven frame loop (blocks until exit)."""
+        self._tick()
+        self._screen.mainloop()
 
-            if elapsed >= TARGET_FRAME_INTERVAL:
-                self._render_single_frame()
-                self._previous_frame_time = current_time
-            else:
-                time.sleep(IDLE_SLEEP_SECONDS)
+    def _tick(self) -> None:
+        """Render one frame if anything changed, then schedule the next tick.
 
-        self._screen.bye()
+        Frames are paced by Tk's own timer via ``ontimer`` so the process
+        sleeps inside the event loop between frames instead of polling.
+        """
+        if self._frame_is_stale():
+            self._render_single_frame()
+            self._needs_redraw = False
+            interval_ms = TARGET_FRAME_INTERVAL_MS
+        else:
+            # The last frame is still accurate; check back a little later
+            interval_ms = SETTLED_FRAME_INTERVAL_MS
+        self._screen.ontimer(self._tick, interval_ms)
+
+    def _frame_is_stale(self) -> bool:
+        """Return True when the next frame would differ from the last one."""
+        return (
+            self._needs_redraw
+            or self._input_handler.has_held_keys
+            or not self._camera.is_settled()
+        )
 
     # -- Frame pipeline ----------------------------------------------------
 
@@ -660,80 +887,79 @@ class SuburbanSceneRenderer:
         """Process input, update camera, draw scene, and refresh."""
         self._input_handler.apply_held_keys_to_camera()
         self._camera.interpolate_toward_targets()
-        self._pen.clear()
+        self._canvas.delete(SCENE_CANVAS_TAG)
         self._draw_all_objects()
         self._hud.draw(self._camera, len(self._scene_objects))
         self._screen.update()
 
     def _draw_all_objects(self) -> None:
-        """Depth-sort scene objects and draw back-to-front."""
-        # Compute average transformed Z for each object
-        depth_sorted_objects = sorted(
-            self._scene_objects,
-            key=lambda obj: self._average_depth(obj),
-            reverse=True,
-        )
+        """Project the scene once, depth-sort objects, and draw back-to-front.
 
-        for wireframe_object in depth_sorted_objects:
-            for start_index, end_index in wireframe_object.edges:
-                if start_index < len(wireframe_object.vertices) and end_index < len(
-                    wireframe_object.vertices
-                ):
-                    self._draw_edge_3d(
-                        wireframe_object.vertices[start_index],
-                        wireframe_object.vertices[end_index],
-                        wireframe_object.color,
-                    )
-
-    def _average_depth(self, wireframe_object: WireframeObject) -> float:
-        """Return the mean Z of all transformed vertices (for depth sorting)."""
-        total_z = sum(
-            self._camera.transform_vertex(vertex).z
-            for vertex in wireframe_object.vertices
+        Consecutive objects that share a color are merged into a single
+        batch.  Lines go straight onto the Tk canvas under the HUD text.
+        """
+        camera = self._camera
+        scene = self._scene
+        projection = scene.project_edges(
+            camera.composite_matrix(), camera.offset_x, camera.offset_y
         )
-        return total_z / len(wireframe_object.vertices)
-
-    def _draw_edge_3d(
-        self,
-        vertex_a: Vector3,
-        vertex_b: Vector3,
-        color: str,
-    ) -> None:
-        """Transform, project, and draw a single 3D edge to the screen."""
-        transformed_a = self._camera.transform_vertex(vertex_a)
-        transformed_b = self._camera.transform_vertex(vertex_b)
-
-        screen_a = transformed_a.project_to_screen()
-        screen_b = transformed_b.project_to_screen()
-
-        # Cull edges that project far outside the visible area
-        if (
-            abs(screen_a.x) > OFF_SCREEN_THRESHOLD
-            or abs(screen_a.y) > OFF_SCREEN_THRESHOLD
-            or abs(screen_b.x) > OFF_SCREEN_THRESHOLD
-            or abs(screen_b.y) > OFF_SCREEN_THRESHOLD
+        segments = projection.segments
+
+        # Zoom and pan never change the relative order, so only re-sort
+        # after the rotation has moved.
+        if camera.rotation_dirty or self._depth_sorted_spans is None:
+            object_depths = scene.object_depths(projection.depth)
+            # Sort indices with a C-level key instead of a Python callback
+            order = sorted(
+                range(len(object_depths)),
+                key=object_depths.__getitem__,
+                reverse=True,
+            )
+            self._depth_sorted_spans = [scene.spans[index] for index in order]
+
+        for color_id, same_color_spans in groupby(
+            self._depth_sorted_spans, key=attrgetter("color_id")
         ):
-            return
+            batch = [
+                segment
+                for span in same_color_spans
+                for segment in segments[
+                    span.edge_offset : span.edge_offset + span.edge_count
+                ]
+                if segment is not None
+            ]
+            self._draw_segments(batch, scene.palette[color_id])
+
+        # The HUD is only rewritten when it changes, so keep it on top
+        self._canvas.tag_lower(SCENE_CANVAS_TAG)
 
-        # Apply camera pan offset
-        final_x1 = screen_a.x + self._camera.offset_x
-        final_y1 = screen_a.y + self._camera.offset_y
-        final_x2 = screen_b.x + self._camera.offset_x
-        final_y2 = screen_b.y + self._camera.offset_y
+    def _draw_segments(self, segments: list[Segment], color: str) -> None:
+        """Draw a batch of projected, pan-adjusted edges in a single color.
 
+        Each line is a single ``create_line`` call on the Tk canvas, which
+        bypasses the turtle state machine entirely.  Segments that start
+        where the previous one ended are merged into one polyline, so
+        chained edges (such as a box face outline) become a single item.
+        """
+        create_line = self._canvas.create_line
+        polyline: list[float] = []
         try:
-            self._pen.color(color)
-            self._pen.penup()
-            self._pen.goto(final_x1, final_y1)
-            self._pen.pendown()
-            self._pen.goto(final_x2, final_y2)
-        except turtle.Terminator:
+            for x1, y1, x2, y2 in segments:
+                if polyline and polyline[-2] == x1 and polyline[-1] == y1:
+                    polyline += (x2, y2)
+                    continue
+                if polyline:
+                    create_line(polyline, fill=color, tags=SCENE_CANVAS_TAG)
+                polyline = [x1, y1, x2, y2]
+            if polyline:
+                create_line(polyline, fill=color, tags=SCENE_CANVAS_TAG)
+        except tkinter.TclError:
             pass  # Window closed mid-draw; ignore gracefully
 
     # -- Callbacks ---------------------------------------------------------
 
     def _request_exit(self) -> None:
-        self._is_running = False
+        self._screen.bye()
 
 
 # ---------------------------------------------------------------------------
@@ -13,9 +13,13 @@ Usage:
     main_lowLevel.py
 """
 
+import itertools
 import math
 import time
+import tkinter
 import turtle
+from array import array
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -31,8 +35,9 @@ PROJECTION_SCALE_FACTOR = 100.0
 NEAR_PLANE_EPSILON = 0.001
 
 OFF_SCREEN_LIMIT = 8000
-TARGET_FRAME_INTERVAL_SECONDS = 0.012  # ~83 FPS
-IDLE_SLEEP_SECONDS = 0.001
+TARGET_FRAME_INTERVAL_MS = 12  # ~83 FPS
+SETTLED_FRAME_INTERVAL_MS = 16  # poll interval once the camera stops moving
+CONVERGENCE_EPSILON = 1e-4
 
 DEFAULT_ROTATION_X = 0.450
 DEFAULT_ROTATION_Y = 3.110
@@ -45,6 +50,27 @@ PAN_INCREMENT = 5.0
 INTERPOLATION_BLEND = 0.12
 MINIMUM_ZOOM = 0.1
 
+# Continuous (hold-to-repeat) keys: key name -> (target_* global it adjusts,
+# change applied each frame while the key is held)
+HELD_KEY_EFFECTS: dict[str, tuple[str, float]] = {
+    "w": ("target_rotation_x", ROTATION_INCREMENT),
+    "s": ("target_rotation_x", -ROTATION_INCREMENT),
+    "d": ("target_rotation_y", ROTATION_INCREMENT),
+    "a": ("target_rotation_y", -ROTATION_INCREMENT),
+    "e": ("target_rotation_z", ROTATION_INCREMENT),
+    "q": ("target_rotation_z", -ROTATION_INCREMENT),
+    "Up": ("target_zoom", ZOOM_INCREMENT),
+    "Down": ("target_zoom", -ZOOM_INCREMENT),
+    "Right": ("target_offset_x", PAN_INCREMENT),
+    "Left": ("target_offset_x", -PAN_INCREMENT),
+    "Page_Up": ("target_offset_y", PAN_INCREMENT),
+    "Page_Down": ("target_offset_y", -PAN_INCREMENT),
+}
+
+# Vertices that agree to this many decimal places are merged into one
+# shared scene vertex when the scene is flattened
+VERTEX_WELD_DECIMALS = 4
+
 # HUD positioning
 HUD_LEFT_COLUMN_X = -580
 HUD_RIGHT_COLUMN_X = 350
@@ -55,6 +81,9 @@ HUD_FONT_TITLE = ("Arial", 16, "bold")
 HUD_FONT_HEADING = ("Arial", 12, "bold")
 HUD_FONT_BODY = ("Arial", 10, "normal")
 
+# Tag shared by every wireframe line drawn straight onto the Tk canvas
+SCENE_CANVAS_TAG = "scene"
+
 
 # ---------------------------------------------------------------------------
 # Global Mutable State
@@ -79,82 +108,93 @@ target_offset_y = 0.0
 # Input tracking
 held_keys: set[str] = set()
 
-# Scene data — each entry: {"vertices": [...], "edges": [...], "color": str}
+# Forces the next loop iteration to draw even if the camera is at rest
+# (cleared by render_single_frame)
+scene_needs_redraw = True
+
+# Scene data — each entry: {"vertices": [...], "edges": [...], "color": str,
+# "centroid": (x, y, z), "radius": float}
 # Vertices are (x, y, z) float tuples; edges are (index_a, index_b) pairs.
 scene_objects: list[dict] = []
 
-# Turtle handles (initialised in setup_turtle_screen)
-drawing_pen: turtle.Turtle | None = None
+# Flattened scene buffers (filled by flatten_scene_buffers). Every mesh's
+# vertices are copied into contiguous float32 coordinate arrays so each
+# vertex is transformed once per frame; edges are stored as flat pairs of
+# vertex indices (a0, b0, a1, b1, ...). Only storage is float32: values are
+# read back as Python floats, so the camera matrix, transform, and
+# projection all run in double precision.
+scene_xs = array("f")
+scene_ys = array("f")
+scene_zs = array("f")
+scene_edges = array("i")
+
+# Per-mesh attributes as parallel lists indexed like scene_objects, so the
+# per-frame path reads plain list slots instead of dict keys. Each mesh's
+# edge pairs are scene_edges[mesh_edge_starts[i]:mesh_edge_ends[i]].
+mesh_colors: list[str] = []
+mesh_centroids: list[tuple[float, float, float]] = []
+mesh_radii: list[float] = []
+mesh_edge_starts: list[int] = []
+mesh_edge_ends: list[int] = []
+
+# Per-vertex screen positions, sized by flatten_scene_buffers and overwritten
+# in place every frame by transform_and_project. These stay plain lists of
+# doubles: the edge loop reads each one several times, and reading from an
+# array would box a new float on every access.
+screen_xs: list[float] = []
+screen_ys: list[float] = []
+
+# Combined rotation + zoom matrix, rebuilt once per frame by
+# render_single_frame (row-major 9-tuple, see build_camera_matrix).
+camera_matrix: tuple[float, ...] = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+# Turtle / Tk handles (initialised in setup_turtle_screen). The wireframe is
+# drawn directly on the underlying Tk canvas; scene_item_ids holds the
+# canvas items of the current frame so they can be deleted in one call.
 display_screen: turtle._Screen | None = None
+scene_canvas: tkinter.Canvas | None = None
+scene_item_ids: list[int] = []
+
+# The control hints are plain canvas text items created once during setup
+# and never touched again; the telemetry pen is rewritten only when its text
+# changes. Neither is affected by the scene's per-frame delete.
+hud_dynamic_pen: turtle.Turtle | None = None
+last_telemetry_lines: list[str] = []
 
 # Animation flag
 renderer_is_running = True
 
 
 # ---------------------------------------------------------------------------
-# Low-Level Vector Math (operates on raw 3-tuples)
+# Camera Matrix
 # ---------------------------------------------------------------------------
 
 
-def rotate_vertex_around_x(
-    vertex: tuple[float, float, float],
-    angle_radians: float,
-) -> tuple[float, float, float]:
-    """Rotate a (x, y, z) vertex around the X axis."""
-    vx, vy, vz = vertex
-    cos_a = math.cos(angle_radians)
-    sin_a = math.sin(angle_radians)
-    return (vx, vy * cos_a - vz * sin_a, vy * sin_a + vz * cos_a)
-
-
-def rotate_vertex_around_y(
-    vertex: tuple[float, float, float],
-    angle_radians: float,
-) -> tuple[float, float, float]:
-    """Rotate a (x, y, z) vertex around the Y axis."""
-    vx, vy, vz = vertex
-    cos_a = math.cos(angle_radians)
-    sin_a = math.sin(angle_radians)
-    return (vx * cos_a + vz * sin_a, vy, -vx * sin_a + vz * cos_a)
-
-
-def rotate_vertex_around_z(
-    vertex: tuple[float, float, float],
-    angle_radians: float,
-) -> tuple[float, float, float]:
-    """Rotate a (x, y, z) vertex around the Z axis."""
-    vx, vy, vz = vertex
-    cos_a = math.cos(angle_radians)
-    sin_a = math.sin(angle_radians)
-    return (vx * cos_a - vy * sin_a, vx * sin_a + vy * cos_a, vz)
-
-
-def apply_camera_transform(
-    vertex: tuple[float, float, float],
-) -> tuple[float, float, float]:
-    """Apply global camera rotation and zoom to a single vertex."""
-    transformed = rotate_vertex_around_x(vertex, camera_rotation_x)
-    transformed = rotate_vertex_around_y(transformed, camera_rotation_y)
-    transformed = rotate_vertex_around_z(transformed, camera_rotation_z)
-    tx, ty, tz = transformed
-    return (tx * camera_zoom, ty * camera_zoom, tz * camera_zoom)
+def build_camera_matrix() -> tuple[float, ...]:
+    """Fold the camera's X, Y, Z rotations and zoom into one 3x3 matrix.
 
-
-def project_vertex_to_screen(
-    vertex: tuple[float, float, float],
-) -> tuple[float, float]:
-    """Perspective-project a camera-space vertex to 2D screen coordinates.
-
-    Returns (0, 0) if the vertex sits at or behind the near plane.
+    The result is a row-major 9-tuple equal to ``zoom * Rz @ Ry @ Rx``, so a
+    vertex is rotated around X first, then Y, then Z.
     """
-    _, _, vz = vertex
-    denominator = vz + PROJECTION_FOCAL_DISTANCE
-    if abs(denominator) < NEAR_PLANE_EPSILON:
-        return (0.0, 0.0)
-    perspective_factor = PROJECTION_FOCAL_DISTANCE / denominator
-    screen_x = vertex[0] * perspective_factor * PROJECTION_SCALE_FACTOR
-    screen_y = vertex[1] * perspective_factor * PROJECTION_SCALE_FACTOR
-    return (screen_x, screen_y)
+    cos_x = math.cos(camera_rotation_x)
+    sin_x = math.sin(camera_rotation_x)
+    cos_y = math.cos(camera_rotation_y)
+    sin_y = math.sin(camera_rotation_y)
+    cos_z = math.cos(camera_rotation_z)
+    sin_z = math.sin(camera_rotation_z)
+    zoom = camera_zoom
+
+    return (
+        zoom * cos_z * cos_y,
+        zoom * (cos_z * sin_y * sin_x - sin_z * cos_x),
+        zoom * (cos_z * sin_y * cos_x + sin_z * sin_x),
+        zoom * sin_z * cos_y,
+        zoom * (sin_z * sin_y * sin_x + cos_z * cos_x),
+        zoom * (sin_z * sin_y * cos_x - cos_z * sin_x),
+        zoom * -sin_y,
+        zoom * cos_y * sin_x,
+        zoom * cos_y * cos_x,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -187,21 +227,29 @@ def create_box_mesh(
         (center_x + half_w, base_y + height, center_z + half_d),
         (center_x - half_w, base_y + height, center_z + half_d),
     ]
+    # Ordered so consecutive edges chain end-to-start: the renderer merges
+    # such runs into one polyline (bottom + pillar + top, then 3 pillars).
     edges = [
         (0, 1),
         (1, 2),
         (2, 3),
         (3, 0),  # bottom
+        (0, 4),  # vertical pillar
         (4, 5),
         (5, 6),
         (6, 7),
         (7, 4),  # top
-        (0, 4),
         (1, 5),
         (2, 6),
-        (3, 7),  # vertical pillars
+        (3, 7),  # remaining vertical pillars
     ]
-    return {"vertices": vertices, "edges": edges, "color": color}
+    return {
+        "vertices": vertices,
+        "edges": edges,
+        "color": color,
+        "centroid": compute_mesh_centroid(vertices),
+        "radius": compute_mesh_radius(vertices),
+    }
 
 
 def create_prism_roof_mesh(
@@ -229,18 +277,22 @@ def create_prism_roof_mesh(
         (center_x - half_w, base_y, center_z + half_d),
     ]
 
+    # Slopes are split so that base -> slope -> ridge -> slope chains
+    # end-to-start and is merged into one polyline by the renderer.
     if ridge_along_z:
         ridge_verts = [
             (center_x, base_y + peak_height, center_z - half_d),
             (center_x, base_y + peak_height, center_z + half_d),
         ]
-        slope_edges = [(0, 4), (1, 4), (2, 5), (3, 5)]
+        chained_slope_edges = [(0, 4), (5, 2)]
+        other_slope_edges = [(1, 4), (3, 5)]
     else:
         ridge_verts = [
             (center_x - half_w, base_y + peak_height, center_z),
             (center_x + half_w, base_y + peak_height, center_z),
         ]
-        slope_edges = [(0, 4), (3, 4), (1, 5), (2, 5)]
+        chained_slope_edges = [(0, 4), (5, 1)]
+        other_slope_edges = [(3, 4), (2, 5)]
 
     vertices = base_verts + ridge_verts
     edges = [
@@ -248,10 +300,40 @@ def create_prism_roof_mesh(
         (1, 2),
         (2, 3),
         (3, 0),  # base rectangle
-        *slope_edges,  # slopes
+        chained_slope_edges[0],  # slope up to the ridge
         (4, 5),  # ridge line
+        chained_slope_edges[1],  # slope back down
+        *other_slope_edges,  # remaining slopes
     ]
-    return {"vertices": vertices, "edges": edges, "color": color}
+    return {
+        "vertices": vertices,
+        "edges": edges,
+        "color": color,
+        "centroid": compute_mesh_centroid(vertices),
+        "radius": compute_mesh_radius(vertices),
+    }
+
+
+def compute_mesh_centroid(
+    vertices: list[tuple[float, float, float]],
+) -> tuple[float, float, float]:
+    """Return the mean of a mesh's vertices.
+
+    The camera transform is linear, so the transformed centroid's depth is
+    exactly the mean transformed depth of the vertices.
+    """
+    count = len(vertices)
+    return (
+        sum(vertex[0] for vertex in vertices) / count,
+        sum(vertex[1] for vertex in vertices) / count,
+        sum(vertex[2] for vertex in vertices) / count,
+    )
+
+
+def compute_mesh_radius(vertices: list[tuple[float, float, float]]) -> float:
+    """Return the distance from a mesh's centroid to its farthest vertex."""
+    centroid = compute_mesh_centroid(vertices)
+    return max(math.dist(vertex, centroid) for vertex in vertices)
 
 
 # ---------------------------------------------------------------------------
@@ -391,6 +473,65 @@ def build_full_scene() -> None:
     # --- Origin axis indicator (debugging) --------------------------------
     scene_objects.append(create_box_mesh(0, 0, 0, 1, 0.1, 0.1, "red"))
 
+    flatten_scene_buffers()
+
+
+def flatten_scene_buffers() -> None:
+    """Copy every mesh into the global vertex/edge and per-mesh buffers.
+
+    Vertices shared between meshes (walls meeting roofs, windows flush with
+    walls, ...) are welded into a single scene vertex through a lookup keyed
+    on rounded coordinates, so each is transformed only once per frame.
+    Edge indices are rebased onto the global vertex list, and invalid edges
+    (pointing past the mesh's own vertices) are dropped here once instead of
+    being re-checked every frame.
+    """
+    per_mesh_lists = (
+        mesh_colors,
+        mesh_centroids,
+        mesh_radii,
+        mesh_edge_starts,
+        mesh_edge_ends,
+    )
+    for values in (scene_xs, scene_ys, scene_zs, scene_edges):
+        del values[:]
+    for values in per_mesh_lists:
+        values.clear()
+    vertex_lut: dict[tuple[float, float, float], int] = {}
+
+    for mesh in scene_objects:
+        vertices = mesh["vertices"]
+        mesh_edge_starts.append(len(scene_edges))
+
+        # Map each local vertex index to its shared scene vertex index
+        scene_indices = []
+        for vx, vy, vz in vertices:
+            key = (
+                round(vx, VERTEX_WELD_DECIMALS),
+                round(vy, VERTEX_WELD_DECIMALS),
+                round(vz, VERTEX_WELD_DECIMALS),
+            )
+            scene_index = vertex_lut.get(key)
+            if scene_index is None:
+                scene_index = len(scene_xs)
+                vertex_lut[key] = scene_index
+                scene_xs.append(vx)
+                scene_ys.append(vy)
+                scene_zs.append(vz)
+            scene_indices.append(scene_index)
+
+        for index_a, index_b in mesh["edges"]:
+            if index_a < len(vertices) and index_b < len(vertices):
+                scene_edges.append(scene_indices[index_a])
+                scene_edges.append(scene_indices[index_b])
+        mesh_edge_ends.append(len(scene_edges))
+        mesh_colors.append(mesh["color"])
+        mesh_centroids.append(mesh["centroid"])
+        mesh_radii.append(mesh["radius"])
+
+    screen_xs[:] = [0.0] * len(scene_xs)
+    screen_ys[:] = [0.0] * len(scene_xs)
+
 
 # ---------------------------------------------------------------------------
 # Turtle / Screen Setup
@@ -398,8 +539,8 @@ def build_full_scene() -> None:
 
 
 def setup_turtle_screen() -> None:
-    """Initialise the turtle window and drawing pen."""
-    global display_screen, drawing_pen
+    """Initialise the turtle window and pens, and write the static HUD."""
+    global display_screen, scene_canvas, hud_dynamic_pen
 
     display_screen = turtle.Screen()
     display_screen.bgcolor(SCREEN_BACKGROUND_COLOR)
@@ -407,10 +548,19 @@ def setup_turtle_screen() -> None:
     display_screen.setup(SCREEN_WIDTH, SCREEN_HEIGHT)
     display_screen.tracer(0)
 
-    drawing_pen = turtle.Turtle()
-    drawing_pen.speed(0)
-    drawing_pen.pensize(1)
-    drawing_pen.hideturtle()
+    scene_canvas = display_screen.getcanvas()
+    hud_dynamic_pen = create_hidden_pen()
+
+    draw_control_hints()
+
+
+def create_hidden_pen() -> turtle.Turtle:
+    """Return a fast, invisible turtle for drawing lines or text."""
+    pen = turtle.Turtle()
+    pen.speed(0)
+    pen.pensize(1)
+    pen.hideturtle()
+    return pen
 
 
 # ---------------------------------------------------------------------------
@@ -422,21 +572,7 @@ def bind_keyboard_controls() -> None:
     """Register all key press / release handlers on the display screen."""
     display_screen.listen()
 
-    continuous_keys = [
-        "w",
-        "s",
-        "a",
-        "d",
-        "q",
-        "e",
-        "Up",
-        "Down",
-        "Left",
-        "Right",
-        "Page_Up",
-        "Page_Down",
-    ]
-    for key_name in continuous_keys:
+    for key_name in HELD_KEY_EFFECTS:
         # Closure trick: default argument captures current key_name
         display_screen.onkeypress(lambda k=key_name: held_keys.add(k), key_name)
         display_screen.onkeyrelease(lambda k=key_name: held_keys.discard(k), key_name)
@@ -464,39 +600,22 @@ def reset_camera_to_defaults() -> None:
 
 
 def apply_held_keys_to_targets() -> None:
-    """Adjust camera targets based on currently pressed keys."""
-    global target_rotation_x, target_rotation_y, target_rotation_z
-    global target_zoom, target_offset_x, target_offset_y
+    """Adjust camera targets based on currently pressed keys.
+
+    Looks up only the keys actually held in HELD_KEY_EFFECTS, so an idle
+    frame costs a single empty-set check.
+    """
+    global target_zoom
+
+    if not held_keys:
+        return
+
+    module_state = globals()
+    for key_name in held_keys:
+        target_name, delta = HELD_KEY_EFFECTS[key_name]
+        module_state[target_name] += delta
 
-    # Rotation
-    if "w" in held_keys:
-        target_rotation_x += ROTATION_INCREMENT
-    if "s" in held_keys:
-        target_rotation_x -= ROTATION_INCREMENT
-    if "d" in held_keys:
-        target_rotation_y += ROTATION_INCREMENT
-    if "a" in held_keys:
-        target_rotation_y -= ROTATION_INCREMENT
-    if "e" in held_keys:
-        target_rotation_z += ROTATION_INCREMENT
-    if "q" in held_keys:
-        target_rotation_z -= ROTATION_INCREMENT
-
-    # Zoom
-    if "Up" in held_keys:
-        target_zoom = max(MINIMUM_ZOOM, target_zoom + ZOOM_INCREMENT)
-    if "Down" in held_keys:
-        target_zoom = max(MINIMUM_ZOOM, target_zoom - ZOOM_INCREMENT)
-
-    # Pan
-    if "Right" in held_keys:
-        target_offset_x += PAN_INCREMENT
-    if "Left" in held_keys:
-        target_offset_x -= PAN_INCREMENT
-    if "Page_Up" in held_keys:
-        target_offset_y += PAN_INCREMENT
-    if "Page_Down" in held_keys:
-        target_offset_y -= PAN_INCREMENT
+    target_zoom = max(MINIMUM_ZOOM, target_zoom)
 
 
 def interpolate_camera_toward_targets() -> None:
@@ -513,65 +632,202 @@ def interpolate_camera_toward_targets() -> None:
     camera_offset_y += (target_offset_y - camera_offset_y) * blend
 
 
+def camera_has_converged(epsilon: float) -> bool:
+    """Return True when every camera value is within epsilon of its target."""
+    return (
+        abs(target_rotation_x - camera_rotation_x) < epsilon
+        and abs(target_rotation_y - camera_rotation_y) < epsilon
+        and abs(target_rotation_z - camera_rotation_z) < epsilon
+        and abs(target_zoom - camera_zoom) < epsilon
+        and abs(target_offset_x - camera_offset_x) < epsilon
+        and abs(target_offset_y - camera_offset_y) < epsilon
+    )
+
+
 # ---------------------------------------------------------------------------
 # Drawing
 # ---------------------------------------------------------------------------
 
 
-def draw_edge_between_vertices(
-    vertex_a: tuple[float, float, float],
-    vertex_b: tuple[float, float, float],
-    color: str,
+def transform_and_project(matrix: tuple[float, ...]) -> None:
+    """Transform and project every scene vertex into screen_xs / screen_ys.
+
+    Applies the camera matrix and the perspective divide in one loop with the
+    matrix and projection constants held in locals, writing into the
+    preallocated output lists instead of building tuples.
+
+    Vertices at or behind the near plane are written as +inf instead of
+    being projected. That puts them past OFF_SCREEN_LIMIT, so the existing
+    off-screen test in collect_mesh_segments discards every edge touching
+    them rather than drawing them mirrored or collapsed to (0, 0).
+    """
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+    focal_distance = PROJECTION_FOCAL_DISTANCE
+    focal_scale = PROJECTION_FOCAL_DISTANCE * PROJECTION_SCALE_FACTOR
+    epsilon = NEAR_PLANE_EPSILON
+    behind_camera = math.inf
+    xs = screen_xs
+    ys = screen_ys
+
+    for index, (vx, vy, vz) in enumerate(zip(scene_xs, scene_ys, scene_zs)):
+        denominator = m20 * vx + m21 * vy + m22 * vz + focal_distance
+        if denominator <= epsilon:
+            xs[index] = behind_camera
+            ys[index] = behind_camera
+            continue
+        perspective_factor = focal_scale / denominator
+        xs[index] = (m00 * vx + m01 * vy + m02 * vz) * perspective_factor
+        ys[index] = (m10 * vx + m11 * vy + m12 * vz) * perspective_factor
+
+
+def collect_mesh_segments(
+    mesh_index: int,
+    segments: list[tuple[float, float, float, float]],
 ) -> None:
-    """Transform, project, and draw a single wireframe edge."""
-    transformed_a = apply_camera_transform(vertex_a)
-    transformed_b = apply_camera_transform(vertex_b)
-
-    screen_ax, screen_ay = project_vertex_to_screen(transformed_a)
-    screen_bx, screen_by = project_vertex_to_screen(transformed_b)
-
-    # Cull edges projected far off screen
-    if (
-        abs(screen_ax) > OFF_SCREEN_LIMIT
-        or abs(screen_ay) > OFF_SCREEN_LIMIT
-        or abs(screen_bx) > OFF_SCREEN_LIMIT
-        or abs(screen_by) > OFF_SCREEN_LIMIT
-    ):
-        return
+    """Append one mesh's visible edges to *segments* as canvas coordinates.
 
-    # Apply pan offset
-    final_ax = screen_ax + camera_offset_x
-    final_ay = screen_ay + camera_offset_y
-    final_bx = screen_bx + camera_offset_x
-    final_by = screen_by + camera_offset_y
+    Edges with an endpoint projected beyond OFF_SCREEN_LIMIT are culled; the
+    rest get the pan offset applied and their Y flipped, since Tk canvas Y
+    grows downward.
+    """
+    xs = screen_xs
+    ys = screen_ys
+    limit = OFF_SCREEN_LIMIT
+    offset_x = camera_offset_x
+    offset_y = camera_offset_y
+    start = mesh_edge_starts[mesh_index]
+    end = mesh_edge_ends[mesh_index]
+
+    edge_indices = iter(scene_edges[start:end])
+    for index_a, index_b in zip(edge_indices, edge_indices):
+        screen_ax = xs[index_a]
+        screen_ay = ys[index_a]
+        screen_bx = xs[index_b]
+        screen_by = ys[index_b]
+        if (
+            abs(screen_ax) > limit
+            or abs(screen_ay) > limit
+            or abs(screen_bx) > limit
+            or abs(screen_by) > limit
+        ):
+            continue
+        segments.append(
+            (
+                screen_ax + offset_x,
+                -(screen_ay + offset_y),
+                screen_bx + offset_x,
+                -(screen_by + offset_y),
+            )
+        )
+
+
+def draw_segment_batch(
+    segments: list[tuple[float, float, float, float]],
+    color: str,
+) -> None:
+    """Draw a batch of same-colour canvas segments as wireframe lines.
 
+    Segments that start where the previous one ended are chained into a
+    single polyline, so a box's face outline becomes one canvas item
+    instead of four.
+    """
+    create_line = scene_canvas.create_line
+    polyline: list[float] = []
     try:
-        drawing_pen.color(color)
-        drawing_pen.penup()
-        drawing_pen.goto(final_ax, final_ay)
-        drawing_pen.pendown()
-        drawing_pen.goto(final_bx, final_by)
-    except turtle.Terminator:
+        for x1, y1, x2, y2 in segments:
+            if polyline and polyline[-2] == x1 and polyline[-1] == y1:
+                polyline += (x2, y2)
+                continue
+            if polyline:
+                scene_item_ids.append(
+                    create_line(polyline, fill=color, tags=SCENE_CANVAS_TAG)
+                )
+            polyline = [x1, y1, x2, y2]
+        if polyline:
+            scene_item_ids.append(
+                create_line(polyline, fill=color, tags=SCENE_CANVAS_TAG)
+            )
+    except tkinter.TclError:
         pass  # Window closed mid-draw
 
 
-def compute_average_depth(mesh: dict) -> float:
-    """Return mean transformed Z across all vertices in a mesh."""
-    vertices = mesh["vertices"]
-    total_z = sum(apply_camera_transform(v)[2] for v in vertices)
-    return total_z / len(vertices)
+def make_depth_key(matrix: tuple[float, ...]) -> Callable[[int], float]:
+    """Return a sort key giving a mesh's camera-space centroid depth.
+
+    The matrix's Z row and the centroid list are bound once per frame as
+    default arguments, so each key call only reads locals.
+    """
+
+    def depth_key(
+        mesh_index: int,
+        row_x: float = matrix[6],
+        row_y: float = matrix[7],
+        row_z: float = matrix[8],
+        centroids: list[tuple[float, float, float]] = mesh_centroids,
+    ) -> float:
+        centroid_x, centroid_y, centroid_z = centroids[mesh_index]
+        return row_x * centroid_x + row_y * centroid_y + row_z * centroid_z
+
+    return depth_key
+
+
+def mesh_is_culled(mesh_index: int, matrix: tuple[float, ...]) -> bool:
+    """Return True if no edge of a mesh can be drawn this frame.
+
+    Uses the mesh's bounding sphere: the mesh is skipped when the whole
+    sphere lies behind the near plane, or when it lies in front of the
+    camera and every point of it projects beyond OFF_SCREEN_LIMIT, so the
+    per-edge check would have rejected every edge anyway.
+    """
+    centroid_x, centroid_y, centroid_z = mesh_centroids[mesh_index]
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix
+    radius = mesh_radii[mesh_index] * camera_zoom
+
+    center_x = m00 * centroid_x + m01 * centroid_y + m02 * centroid_z
+    center_y = m10 * centroid_x + m11 * centroid_y + m12 * centroid_z
+    center_z = m20 * centroid_x + m21 * centroid_y + m22 * centroid_z
+
+    nearest_denominator = center_z + PROJECTION_FOCAL_DISTANCE - radius
+    farthest_denominator = center_z + PROJECTION_FOCAL_DISTANCE + radius
+    if farthest_denominator < NEAR_PLANE_EPSILON:
+        return True  # Entirely behind the camera
+    if nearest_denominator < NEAR_PLANE_EPSILON:
+        return False  # Straddles the near plane; let the edges decide
+
+    # Smallest projected |x| or |y| any point of the sphere can reach
+    projection_scale = (
+        PROJECTION_FOCAL_DISTANCE * PROJECTION_SCALE_FACTOR / farthest_denominator
+    )
+    nearest_x = (abs(center_x) - radius) * projection_scale
+    nearest_y = (abs(center_y) - radius) * projection_scale
+    return nearest_x > OFF_SCREEN_LIMIT or nearest_y > OFF_SCREEN_LIMIT
 
 
 def draw_all_scene_objects() -> None:
-    """Depth-sort and draw every object in the global scene list."""
-    sorted_objects = sorted(scene_objects, key=compute_average_depth, reverse=True)
+    """Replace last frame's lines with the depth-sorted scene, back-to-front."""
+    if scene_item_ids:
+        scene_canvas.delete(*scene_item_ids)
+        scene_item_ids.clear()
+
+    matrix = camera_matrix
+    transform_and_project(matrix)
+    visible_meshes = [
+        mesh_index
+        for mesh_index in range(len(mesh_colors))
+        if not mesh_is_culled(mesh_index, matrix)
+    ]
+    visible_meshes.sort(key=make_depth_key(matrix), reverse=True)
 
-    for mesh in sorted_objects:
-        vertices = mesh["vertices"]
-        color = mesh["color"]
-        for index_a, index_b in mesh["edges"]:
-            if index_a < len(vertices) and index_b < len(vertices):
-                draw_edge_between_vertices(vertices[index_a], vertices[index_b], color)
+    # Consecutive meshes that share a colour are drawn as one batch; only
+    # runs are merged, so the back-to-front order is preserved.
+    for color, run in itertools.groupby(visible_meshes, key=mesh_colors.__getitem__):
+        segments = []
+        for mesh_index in run:
+            collect_mesh_segments(mesh_index, segments)
+        draw_segment_batch(segments, color)
+
+    # Keep the wireframe underneath the HUD text written by the turtle pens
+    scene_canvas.tag_lower(SCENE_CANVAS_TAG)
 
 
 # ---------------------------------------------------------------------------
@@ -580,27 +836,40 @@ def draw_all_scene_objects() -> None:
 
 
 def write_text_at(
+    pen: turtle.Turtle,
     x: float,
     y: float,
     text: str,
     font: tuple = HUD_FONT_BODY,
 ) -> None:
-    """Write a string at an absolute screen position."""
-    drawing_pen.penup()
-    drawing_pen.goto(x, y)
-    drawing_pen.color("black")
-    drawing_pen.write(text, font=font)
+    """Write a string at an absolute screen position with the given pen."""
+    pen.penup()
+    pen.goto(x, y)
+    pen.color("black")
+    pen.write(text, font=font)
 
 
-def draw_heads_up_display() -> None:
-    """Render control hints and camera telemetry on the canvas."""
-    # -- Left column: title and controls -----------------------------------
+def create_static_text(
+    x: float,
+    y: float,
+    text: str,
+    font: tuple = HUD_FONT_BODY,
+) -> None:
+    """Place persistent text on the canvas at a turtle-style position.
+
+    Anchored like turtle's left-aligned write(), with Y flipped for Tk.
+    """
+    scene_canvas.create_text(x, -y, text=text, anchor="sw", fill="black", font=font)
+
+
+def draw_control_hints() -> None:
+    """Create the static title and control hints (left column) once."""
     col_x = HUD_LEFT_COLUMN_X
     row_y = HUD_TOP_ROW_Y
 
-    write_text_at(col_x, row_y, "3D Rendered House", HUD_FONT_TITLE)
+    create_static_text(col_x, row_y, "3D Rendered House", HUD_FONT_TITLE)
     row_y -= HUD_ROW_HEIGHT + 10
-    write_text_at(
+    create_static_text(
         col_x, row_y, "Movement Controls (Hold for continuous):", HUD_FONT_HEADING
     )
 
@@ -615,13 +884,25 @@ def draw_heads_up_display() -> None:
     ]
     for hint_line in control_hints:
         row_y -= HUD_ROW_HEIGHT
-        write_text_at(col_x, row_y, hint_line)
+        create_static_text(col_x, row_y, hint_line)
+
 
-    # -- Right column: camera telemetry ------------------------------------
+def draw_camera_telemetry(telemetry_lines: list[str]) -> None:
+    """Clear and rewrite the camera telemetry column (right column)."""
     col_x = HUD_RIGHT_COLUMN_X
     row_y = HUD_TOP_ROW_Y
 
-    write_text_at(col_x, row_y, "Camera Status:", HUD_FONT_HEADING)
+    hud_dynamic_pen.clear()
+    write_text_at(hud_dynamic_pen, col_x, row_y, "Camera Status:", HUD_FONT_HEADING)
+    for line in telemetry_lines:
+        row_y -= HUD_ROW_HEIGHT
+        write_text_at(hud_dynamic_pen, col_x, row_y, line)
+
+
+def draw_heads_up_display() -> None:
+    """Refresh the camera telemetry if its displayed text has changed."""
+    global last_telemetry_lines
+
     telemetry_lines = [
         f"Rotation X: {camera_rotation_x:.3f}",
         f"Rotation Y: {camera_rotation_y:.3f}",
@@ -629,9 +910,9 @@ def draw_heads_up_display() -> None:
         f"Zoom: {camera_zoom:.3f}",
         f"Objects: {len(scene_objects)}",
     ]
-    for line in telemetry_lines:
-        row_y -= HUD_ROW_HEIGHT
-        write_text_at(col_x, row_y, line)
+    if telemetry_lines != last_telemetry_lines:
+        draw_camera_telemetry(telemetry_lines)
+        last_telemetry_lines = telemetry_lines
 
 
 # ---------------------------------------------------------------------------
@@ -641,12 +922,14 @@ def draw_heads_up_display() -> None:
 
 def render_single_frame() -> None:
     """Execute one complete frame: input -> update -> draw -> flip."""
+    global camera_matrix, scene_needs_redraw
     apply_held_keys_to_targets()
     interpolate_camera_toward_targets()
-    drawing_pen.clear()
+    camera_matrix = build_camera_matrix()
     draw_all_scene_objects()
     draw_heads_up_display()
     display_screen.update()
+    scene_needs_redraw = False
 
 
 # ---------------------------------------------------------------------------
@@ -655,27 +938,46 @@ def render_single_frame() -> None:
 
 
 def request_exit() -> None:
-    """Signal the animation loop to stop."""
+    """Signal the frame timer to stop and close the window."""
     global renderer_is_running
     renderer_is_running = False
 
 
-def run_animation_loop() -> None:
-    """Block on the main render loop until the user exits."""
-    global renderer_is_running
-    previous_frame_time = time.time()
+def frame_needs_render() -> bool:
+    """Return True if a key is held or the camera is still moving."""
+    return (
+        scene_needs_redraw
+        or bool(held_keys)
+        or not camera_has_converged(CONVERGENCE_EPSILON)
+    )
 
-    while renderer_is_running:
-        current_time = time.time()
-        elapsed_seconds = current_time - previous_frame_time
 
-        if elapsed_seconds >= TARGET_FRAME_INTERVAL_SECONDS:
-            render_single_frame()
-            previous_frame_time = current_time
-        else:
-            time.sleep(IDLE_SLEEP_SECONDS)
+def animation_tick() -> None:
+    """Render a frame if anything changed, then re-arm the frame timer.
 
-    display_screen.bye()
+    The next tick is scheduled for whatever is left of the frame budget
+    after rendering, or at the slower settled interval when the frame was
+    skipped because nothing moved.
+    """
+    if not renderer_is_running:
+        display_screen.bye()
+        return
+
+    if frame_needs_render():
+        frame_start = time.perf_counter()
+        render_single_frame()
+        elapsed_ms = (time.perf_counter() - frame_start) * 1000.0
+        delay_ms = max(1, round(TARGET_FRAME_INTERVAL_MS - elapsed_ms))
+    else:
+        delay_ms = SETTLED_FRAME_INTERVAL_MS
+
+    display_screen.ontimer(animation_tick, delay_ms)
+
+
+def run_animation_loop() -> None:
+    """Start the frame timer and block in Tk's event loop until exit."""
+    animation_tick()
+    display_screen.mainloop()
 
 
 # ---------------------------------------------------------------------------